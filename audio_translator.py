@@ -1,12 +1,28 @@
+import io
 import os
 from pathlib import Path
-import whisper
+import ctranslate2
+from faster_whisper import WhisperModel
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import TooManyRequests
 from gtts import gTTS
+from gtts.tts import gTTSError
+import deep_translator.google
+import requests
+from requests.adapters import HTTPAdapter
+from nltk.tokenize.punkt import PunktTokenizer
 import logging
+import re
+import base64
+import urllib.request
+import functools
 import sys
 import time
 import argparse
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -15,9 +31,393 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Whisper inference settings (CTranslate2 backend)
+# Use the GPU automatically when CTranslate2 can see one
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu")
+WHISPER_COMPUTE_TYPE = os.getenv(
+    "WHISPER_COMPUTE_TYPE", "int8_float16" if WHISPER_DEVICE == "cuda" else "int8"
+)
+# An automatically chosen GPU falls back to the CPU if CUDA turns out to be unusable
+WHISPER_DEVICE_AUTO = "WHISPER_DEVICE" not in os.environ
+WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+WHISPER_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "true").lower() in ("1", "true", "yes")
+WHISPER_VAD_MIN_SILENCE_MS = int(os.getenv("WHISPER_VAD_MIN_SILENCE_MS", "500"))
+
+# Whisper model, loaded on first use and reused for every file
+WHISPER_MODEL_SIZE = "base"
+whisper_model = None
+
+# Transcripts cached on disk by audio content hash
+ASR_CACHE_DIR = os.getenv("ASR_CACHE_DIR", ".asr_cache")
+ASR_CACHE_TTL = int(os.getenv("ASR_CACHE_TTL", "86400"))
+
+# Decoding options shared by the CLI and the API. A single greedy temperature
+# keeps output deterministic, so it can be cached. VAD skips silent stretches,
+# and not conditioning on the previous window avoids repetition loops that
+# would otherwise need extra decoding passes.
+WHISPER_TRANSCRIBE_OPTIONS = dict(
+    beam_size=WHISPER_BEAM_SIZE,
+    temperature=0,
+    vad_filter=WHISPER_VAD_FILTER,
+    vad_parameters=dict(min_silence_duration_ms=WHISPER_VAD_MIN_SILENCE_MS),
+    condition_on_previous_text=False,
+    word_timestamps=False
+)
+
+def _asr_cache_key(model_size: str) -> str:
+    """
+    Build the part of a transcript cache file name that identifies how it was decoded.
+    
+    The model, compute type and every transcribe option are included, so
+    changing any of them never returns a transcript decoded differently.
+    """
+    options = hashlib.blake2b(repr(sorted(WHISPER_TRANSCRIBE_OPTIONS.items())).encode("utf-8"), digest_size=8)
+    return f"{model_size}_{WHISPER_COMPUTE_TYPE}_{options.hexdigest()}"
+
+# Translation batching settings
+TRANSLATE_BATCH_CHARS = 4000
+TRANSLATE_SEPARATOR = "\n⟂\n"
+TRANSLATE_CONCURRENCY = int(os.getenv("TRANSLATE_CONCURRENCY", "8"))
+TRANSLATE_RPS = float(os.getenv("TRANSLATE_RPS", "10"))
+
+# Text-to-speech concurrency
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))
+
+# Sentence translation cache
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "100000"))
+TRANSLATION_CACHE_MIN_CHARS = 4
+
+# Shared HTTP connection pool for translation and TTS requests
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 64
+
+def _create_http_session() -> requests.Session:
+    """
+    Create a keep-alive session shared by the translation and TTS clients.
+    
+    Reusing pooled connections avoids a TCP and TLS handshake on every request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+http_session = _create_http_session()
+
+# deep_translator calls requests.get() directly and takes no session, so point
+# its Google module at the shared session instead
+deep_translator.google.requests = http_session
+
+class PooledGTTS(gTTS):
+    """
+    gTTS that sends its API requests over the shared keep-alive session.
+    
+    gTTS.stream() opens a new requests.Session for every ~100-character part;
+    this override is otherwise the same request/decode loop.
+    """
+    
+    def stream(self):
+        for idx, prepared_request in enumerate(self._prepare_requests()):
+            try:
+                response = http_session.send(
+                    prepared_request,
+                    proxies=urllib.request.getproxies(),
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                raise gTTSError(tts=self, response=response)
+            except requests.exceptions.RequestException:
+                raise gTTSError(tts=self)
+            
+            for line in response.iter_lines(chunk_size=1024):
+                decoded_line = line.decode("utf-8")
+                if "jQ1olc" in decoded_line:
+                    audio_search = re.search(r'jQ1olc","\[\\"(.*)\\"]', decoded_line)
+                    if not audio_search:
+                        # Good response, but no audio stream in it
+                        raise gTTSError(tts=self, response=response)
+                    yield base64.b64decode(audio_search.group(1).encode("ascii"))
+            logger.debug(f"TTS part {idx} received")
+
+# Sentences end at terminal punctuation followed by whitespace or end of line
+SENTENCE_PATTERN = re.compile(r'\S.*?(?:[.!?]+(?=\s|$)|$)')
+
+@functools.lru_cache(maxsize=1)
+def _get_sentence_tokenizer():
+    """
+    Load the NLTK Punkt sentence tokenizer, or None if its data isn't installed.
+    """
+    try:
+        return PunktTokenizer("english")
+    except LookupError:
+        logger.warning("NLTK punkt_tab data not found, falling back to regex sentence splitting")
+        return None
+
+def _split_sentences(text: str) -> tuple:
+    """
+    Split text into sentences, keeping the whitespace that follows each one.
+    
+    Lines are split apart first, then each line is tokenized with Punkt, which
+    handles abbreviations like "Dr." and decimals, or with a regex fallback.
+    Returns the sentences and their trailing separators, so that
+    ''.join(s + sep for s, sep in zip(sentences, separators)) restores the
+    original spacing.
+    """
+    tokenizer = _get_sentence_tokenizer()
+    spans = []
+    for line in re.finditer(r'[^\n]+', text):
+        offset = line.start()
+        if tokenizer is not None:
+            line_spans = tokenizer.span_tokenize(line.group())
+        else:
+            line_spans = (match.span() for match in SENTENCE_PATTERN.finditer(line.group()))
+        for start, end in line_spans:
+            if text[offset + start:offset + end].strip():
+                spans.append((offset + start, offset + end))
+    
+    sentences = [text[start:end] for start, end in spans]
+    separators = [text[end:next_start] for (_, end), (next_start, _) in zip(spans, spans[1:])] + [""]
+    return sentences, separators[:len(sentences)]
+
+def _make_batches(sentences: list, max_chars: int = TRANSLATE_BATCH_CHARS) -> list:
+    """
+    Pack sentences into batches whose joined length stays under max_chars.
+    """
+    batches = []
+    current = []
+    size = 0
+    for sentence in sentences:
+        extra = len(sentence) + (len(TRANSLATE_SEPARATOR) if current else 0)
+        if current and size + extra > max_chars:
+            batches.append(current)
+            current = []
+            size = 0
+            extra = len(sentence)
+        current.append(sentence)
+        size += extra
+    if current:
+        batches.append(current)
+    return batches
+
+# Retry policy for throttled translation/TTS requests
+MAX_RETRIES = 3
+
+class RateLimitError(Exception):
+    """Raised when a provider keeps throttling requests after all retries."""
+
+def _is_rate_limit(error: Exception) -> bool:
+    """
+    Check whether an exception signals provider throttling.
+    
+    Only the exception type and HTTP status are used: error messages can
+    contain the text being translated, which may mention "quota" or "429".
+    """
+    if isinstance(error, TooManyRequests):
+        return True
+    if isinstance(error, gTTSError):
+        return getattr(error.rsp, "status_code", None) == 429
+    if isinstance(error, requests.exceptions.HTTPError):
+        return getattr(error.response, "status_code", None) == 429
+    return False
+
+def _with_retry(func, *args, **kwargs):
+    """
+    Call func, backing off exponentially while the provider rate-limits us.
+    
+    Any other error is raised immediately without retrying.
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if not _is_rate_limit(e):
+                raise
+            if attempt == MAX_RETRIES - 1:
+                raise RateLimitError(f"Rate limited after {MAX_RETRIES} attempts ({type(e).__name__})") from e
+            delay = 2 ** attempt
+            logger.warning(f"Rate limited ({type(e).__name__}), retrying in {delay}s")
+            time.sleep(delay)
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing up to `rate` acquisitions per second.
+    
+    Callers only wait when the bucket is empty, so requests go out as soon as
+    the provider's budget allows instead of after a fixed delay.
+    """
+    
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        # Hold at least one token so fractional rates can still admit requests
+        self.capacity = max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+translate_limiter = RateLimiter(TRANSLATE_RPS)
+
+# GoogleTranslator instances, one per language in each worker thread
+_translators = threading.local()
+
+def _get_translator(language: str) -> GoogleTranslator:
+    """
+    Return this thread's GoogleTranslator for a language, creating it on first use.
+    
+    GoogleTranslator stores request parameters on the instance during
+    translate(), so instances are reused within a thread but never shared.
+    """
+    cache = getattr(_translators, "by_language", None)
+    if cache is None:
+        cache = _translators.by_language = {}
+    if language not in cache:
+        cache[language] = GoogleTranslator(source='auto', target=language)
+    return cache[language]
+
+def _translate_batch(batch: list, language: str, acquire=None) -> list:
+    """
+    Translate a batch of sentences in a single request.
+    
+    The sentences are joined with a separator token and split again after
+    translation. If the request fails or the separators don't survive, the
+    batch is halved and each half is retried. Rate-limit errors are not split
+    and propagate once retries are exhausted.
+    
+    acquire, if given, is called before every request, including retries and
+    the requests for halved batches, so a rate limit holds on failures too.
+    """
+    def _request():
+        if acquire is not None:
+            acquire()
+        return _get_translator(language).translate(TRANSLATE_SEPARATOR.join(batch))
+    
+    try:
+        translated = _with_retry(_request)
+        parts = [p.strip() for p in re.split(r'\s*⟂\s*', translated or '')]
+        if len(parts) == len(batch):
+            return parts
+        logger.warning(f"Separator mismatch in batch of {len(batch)} sentences")
+    except RateLimitError:
+        # Splitting the batch would only send more requests to a throttled provider
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to translate batch of {len(batch)} sentences: {str(e)}")
+    
+    if len(batch) == 1:
+        # Keep the original sentence if translation fails
+        return batch
+    
+    middle = len(batch) // 2
+    return (
+        _translate_batch(batch[:middle], language, acquire)
+        + _translate_batch(batch[middle:], language, acquire)
+    )
+
+class TranslationCache:
+    """
+    Bounded LRU cache of sentence translations.
+    
+    Entries are keyed by the blake2b digest of the sentence and the target
+    language. Sentences shorter than TRANSLATION_CACHE_MIN_CHARS are not cached.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(sentence: str, language: str) -> tuple:
+        return hashlib.blake2b(sentence.encode('utf-8'), digest_size=16).digest(), language
+    
+    def lookup(self, sentences: list, language: str) -> list:
+        """
+        Return the cached translation of each sentence, or None on a miss.
+        """
+        results = []
+        with self._lock:
+            for sentence in sentences:
+                translated = None
+                if len(sentence) >= TRANSLATION_CACHE_MIN_CHARS:
+                    key = self._key(sentence, language)
+                    translated = self._entries.get(key)
+                    if translated is not None:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                    else:
+                        self.misses += 1
+                results.append(translated)
+            total = self.hits + self.misses
+            if total:
+                logger.info(f"Translation cache hit rate: {self.hits / total:.1%} ({self.hits} hits, {self.misses} misses)")
+        return results
+    
+    def store(self, sentences: list, translations: list, language: str):
+        """
+        Cache translations, evicting the least recently used entries.
+        """
+        with self._lock:
+            for sentence, translated in zip(sentences, translations):
+                # Skip short sentences and ones kept untranslated after a failure
+                if len(sentence) < TRANSLATION_CACHE_MIN_CHARS or translated == sentence:
+                    continue
+                key = self._key(sentence, language)
+                self._entries[key] = translated
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+translation_cache = TranslationCache(TRANSLATION_CACHE_SIZE)
+
+def get_whisper_model() -> WhisperModel:
+    """
+    Return the shared Whisper model, loading it on first use.
+    
+    Returns:
+        WhisperModel: Loaded faster-whisper model
+    """
+    global whisper_model
+    if whisper_model is None:
+        logger.info(f"Loading Whisper model ({WHISPER_DEVICE}, {WHISPER_COMPUTE_TYPE})...")
+        try:
+            whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE, compute_type=WHISPER_COMPUTE_TYPE)
+        except Exception as e:
+            if WHISPER_DEVICE != "cuda" or not WHISPER_DEVICE_AUTO:
+                raise
+            logger.warning(f"Failed to load Whisper model on CUDA ({str(e)}), falling back to CPU")
+            whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device="cpu", compute_type="int8")
+    return whisper_model
+
+def _hash_file(path: str) -> str:
+    """
+    Compute the blake2b hex digest of a file, reading it in 1 MiB chunks.
+    """
+    hasher = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
 def transcribe_audio(audio_path: str) -> str:
     """
-    Transcribe audio file to text using Whisper model.
+    Transcribe audio file to text using the faster-whisper model.
     
     Args:
         audio_path (str): Path to the audio file
@@ -26,11 +426,25 @@ def transcribe_audio(audio_path: str) -> str:
         str: Transcribed text
     """
     try:
-        logger.info("Loading Whisper model...")
-        model = whisper.load_model("base")
+        # Reuse the transcript of identical audio if it is cached
+        cache_path = Path(ASR_CACHE_DIR) / f"{_hash_file(audio_path)}_{_asr_cache_key(WHISPER_MODEL_SIZE)}.txt"
+        if cache_path.exists():
+            if time.time() - cache_path.stat().st_mtime <= ASR_CACHE_TTL:
+                logger.info("Using cached transcript")
+                return cache_path.read_text(encoding="utf-8")
+            # Drop the expired transcript so the cache doesn't grow without bound
+            cache_path.unlink(missing_ok=True)
+        
         logger.info("Transcribing audio...")
-        result = model.transcribe(audio_path)
-        return result["text"]
+        segments, info = get_whisper_model().transcribe(audio_path, **WHISPER_TRANSCRIBE_OPTIONS)
+        text = "".join(segment.text for segment in segments).strip()
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(text, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Failed to cache transcript: {str(e)}")
+        return text
     except Exception as e:
         logger.error(f"Error during transcription: {str(e)}")
         raise
@@ -48,27 +462,27 @@ def translate_text(text: str, target_language: str = 'es') -> str:
     """
     try:
         logger.info("Translating text...")
-        # Split text into smaller chunks (sentences)
-        sentences = text.split('. ')
-        translated_sentences = []
+        # Split text into sentences and translate only the ones not already cached
+        sentences, separators = _split_sentences(text)
+        translated_sentences = translation_cache.lookup(sentences, target_language)
+        missing = [i for i, translated in enumerate(translated_sentences) if translated is None]
+        batches = _make_batches([sentences[i] for i in missing])
+        results = []
         
-        for sentence in sentences:
-            if not sentence.strip():
-                continue
-                
-            try:
-                # Add a small delay to avoid rate limiting
-                time.sleep(0.5)
-                translator = GoogleTranslator(source='auto', target=target_language)
-                translated = translator.translate(sentence)
-                translated_sentences.append(translated)
-                logger.info(f"Translated: {sentence[:50]}...")
-            except Exception as e:
-                logger.warning(f"Failed to translate sentence: {str(e)}")
-                # Keep the original sentence if translation fails
-                translated_sentences.append(sentence)
+        def _translate(batch: list) -> list:
+            return _translate_batch(batch, target_language, translate_limiter.acquire)
         
-        return '. '.join(translated_sentences)
+        # Translate batches concurrently; map() preserves input order
+        with ThreadPoolExecutor(max_workers=TRANSLATE_CONCURRENCY) as pool:
+            for i, translated in enumerate(pool.map(_translate, batches)):
+                results.extend(translated)
+                logger.info(f"Translated batch {i+1}/{len(batches)} ({len(translated)} sentences)")
+        
+        for i, translated in zip(missing, results):
+            translated_sentences[i] = translated
+        translation_cache.store([sentences[i] for i in missing], results, target_language)
+        
+        return ''.join(sentence + separator for sentence, separator in zip(translated_sentences, separators))
     except Exception as e:
         logger.error(f"Error during translation: {str(e)}")
         raise
@@ -88,38 +502,91 @@ def text_to_speech(text: str, output_path: str, language: str = 'es'):
         max_chunk_size = 5000
         chunks = [text[i:i+max_chunk_size] for i in range(0, len(text), max_chunk_size)]
         
-        # Create temporary files for each chunk
-        temp_files = []
-        for i, chunk in enumerate(chunks):
-            temp_file = f"temp_{i}.mp3"
-            tts = gTTS(text=chunk, lang=language, slow=False)
-            tts.save(temp_file)
-            temp_files.append(temp_file)
+        def _synthesize(i: int, chunk: str) -> bytes:
+            def _request():
+                buffer = io.BytesIO()
+                PooledGTTS(text=chunk, lang=language, slow=False).write_to_fp(buffer)
+                return buffer.getvalue()
+            
+            audio = _with_retry(_request)
             logger.info(f"Created audio chunk {i+1}/{len(chunks)}")
+            return audio
         
-        # Combine all temporary files
-        if len(temp_files) > 1:
-            # Use ffmpeg to concatenate audio files
-            concat_file = "concat_list.txt"
-            with open(concat_file, "w") as f:
-                for temp_file in temp_files:
-                    f.write(f"file '{temp_file}'\n")
-            
-            os.system(f"ffmpeg -f concat -safe 0 -i {concat_file} -c copy {output_path}")
-            
-            # Clean up temporary files
-            for temp_file in temp_files:
-                os.remove(temp_file)
-            os.remove(concat_file)
-        else:
-            # If only one chunk, just rename the file
-            os.rename(temp_files[0], output_path)
+        # Synthesize chunks concurrently in memory; map() preserves order
+        with ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as pool:
+            audio_chunks = list(pool.map(_synthesize, range(len(chunks)), chunks))
+        
+        # gTTS encodes every chunk identically and MPEG frames decode
+        # independently, so write the MP3 bytes back to back
+        with open(output_path, "wb") as output:
+            for audio in audio_chunks:
+                output.write(audio)
             
         logger.info(f"Audio saved to {output_path}")
     except Exception as e:
         logger.error(f"Error during text-to-speech conversion: {str(e)}")
         raise
 
+def translate_audio_file(input_path: str, output_path: str, language: str = 'es'):
+    """
+    Transcribe, translate and synthesize a single audio file.
+    
+    Args:
+        input_path (str): Path to the input audio file
+        output_path (str): Path to save the output audio file
+        language (str): Target language code (default: 'es' for Spanish)
+    """
+    # Step 1: Transcribe audio
+    logger.info("Starting transcription process...")
+    transcribed_text = transcribe_audio(input_path)
+    logger.info("Transcription completed successfully")
+    
+    # Step 2: Translate text
+    translated_text = translate_text(transcribed_text, language)
+    logger.info("Translation completed successfully")
+    
+    # Step 3: Convert to speech
+    text_to_speech(translated_text, output_path, language)
+    logger.info("Text-to-speech conversion completed successfully")
+    
+    logger.info(f"Process completed. Output saved to: {output_path}")
+
+def keep_warm(language: str = 'es') -> int:
+    """
+    Translate audio files whose paths are read from stdin, one per line.
+    
+    The Whisper model is loaded once and reused for every file. Each output
+    is saved next to its input as <name>_<language>.mp3.
+    
+    Args:
+        language (str): Target language code (default: 'es' for Spanish)
+        
+    Returns:
+        int: Number of files that failed
+    """
+    get_whisper_model()
+    logger.info("Model loaded. Reading audio file paths from stdin...")
+    
+    failures = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        input_path = Path(line.strip()).resolve()
+        output_path = input_path.with_name(f"{input_path.stem}_{language}.mp3")
+        try:
+            translate_audio_file(str(input_path), str(output_path), language)
+        except FileNotFoundError as e:
+            if e.filename == str(input_path):
+                logger.error(f"Input file not found: {input_path}")
+            else:
+                logger.error(f"Failed to translate {input_path}: {str(e)}")
+            failures += 1
+        except Exception as e:
+            logger.error(f"Failed to translate {input_path}: {str(e)}")
+            failures += 1
+    return failures
+
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(
@@ -130,7 +597,8 @@ def main():
     parser.add_argument(
         'input_file',
         type=str,
-        help='Path to the input audio file'
+        nargs='?',
+        help='Path to the input audio file (omit when using --keep-warm)'
     )
     
     parser.add_argument(
@@ -153,47 +621,38 @@ def main():
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--keep-warm', '--stdin-paths',
+        action='store_true',
+        help='Keep the Whisper model loaded and translate each audio file path read from stdin'
+    )
+    
     # Parse arguments
     args = parser.parse_args()
+    if not args.keep_warm and not args.input_file:
+        parser.error('input_file is required unless --keep-warm is set')
     
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.keep_warm:
+        sys.exit(1 if keep_warm(args.language) else 0)
+    
+    # resolve() makes both paths absolute relative to the current directory
+    input_path = Path(args.input_file).resolve()
+    output_path = Path(args.output).resolve()
+    
     try:
-        # Get the current directory
-        current_dir = Path.cwd()
-        
-        # Convert input file to absolute path
-        input_path = Path(args.input_file)
-        if not input_path.is_absolute():
-            input_path = current_dir / input_path
-        
-        # Convert output file to absolute path
-        output_path = Path(args.output)
-        if not output_path.is_absolute():
-            output_path = current_dir / output_path
-        
-        # Verify input file exists
-        if not input_path.exists():
+        translate_audio_file(str(input_path), str(output_path), args.language)
+    except FileNotFoundError as e:
+        # Only a missing input is reported as such; other missing files
+        # (model, cache, output directory) are ordinary failures
+        if e.filename == str(input_path):
             logger.error(f"Input file not found: {input_path}")
-            sys.exit(1)
-            
-        # Step 1: Transcribe audio
-        logger.info("Starting transcription process...")
-        transcribed_text = transcribe_audio(str(input_path))
-        logger.info("Transcription completed successfully")
-        
-        # Step 2: Translate text
-        translated_text = translate_text(transcribed_text, args.language)
-        logger.info("Translation completed successfully")
-        
-        # Step 3: Convert to speech
-        text_to_speech(translated_text, str(output_path), args.language)
-        logger.info("Text-to-speech conversion completed successfully")
-        
-        logger.info(f"Process completed. Output saved to: {output_path}")
-        
+        else:
+            logger.error(f"An error occurred: {str(e)}")
+        sys.exit(1)
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         sys.exit(1)
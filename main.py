@@ -1,17 +1,46 @@
+import io
 import os
 import tempfile
 import logging
+import re
 from pathlib import Path
 from typing import Optional
 import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import av
+import numpy as np
 import aiofiles
+import aiofiles.os
+import aiofiles.tempfile
+from aiolimiter import AsyncLimiter
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import whisper
-from deep_translator import GoogleTranslator
-from gtts import gTTS
+from faster_whisper import WhisperModel
 import time
+# Settings and translation/TTS helpers shared with the CLI
+from audio_translator import (
+    WHISPER_DEVICE,
+    WHISPER_COMPUTE_TYPE,
+    WHISPER_DEVICE_AUTO,
+    WHISPER_BEAM_SIZE,
+    WHISPER_TRANSCRIBE_OPTIONS,
+    TRANSLATE_BATCH_CHARS,
+    TRANSLATE_CONCURRENCY,
+    TRANSLATE_RPS,
+    TTS_CONCURRENCY,
+    PooledGTTS,
+    RateLimitError,
+    _asr_cache_key,
+    _split_sentences,
+    _make_batches,
+    _with_retry,
+    _translate_batch,
+    translation_cache,
+)
 
 # Set up logging
 logging.basicConfig(
@@ -30,6 +59,51 @@ app = FastAPI(
 # Global Whisper model (loaded once at startup)
 whisper_model = None
 
+# The API serves the smaller Whisper model; inference settings are shared with the CLI
+WHISPER_MODEL_SIZE = "tiny"
+
+# Translation concurrency: at most TRANSLATE_CONCURRENCY batches in flight,
+# dispatched at no more than TRANSLATE_RPS requests per second
+translate_executor = ThreadPoolExecutor(max_workers=TRANSLATE_CONCURRENCY)
+translate_semaphore = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+# AsyncLimiter cannot admit anything with a capacity below one request, so
+# fractional rates are expressed as one request per 1 / TRANSLATE_RPS seconds
+if TRANSLATE_RPS >= 1:
+    translate_limiter = AsyncLimiter(TRANSLATE_RPS, 1)
+else:
+    translate_limiter = AsyncLimiter(1, 1 / TRANSLATE_RPS)
+
+# Text-to-speech concurrency: at most TTS_CONCURRENCY chunks synthesized at once
+tts_executor = ThreadPoolExecutor(max_workers=TTS_CONCURRENCY)
+tts_semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+# Uploads are copied to disk in 1 MiB chunks
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Transcripts cached on disk by upload content hash
+ASR_CACHE_DIR = os.getenv(
+    "ASR_CACHE_DIR", os.path.join(os.getenv("TEMP_DIR", tempfile.gettempdir()), "asr_cache")
+)
+ASR_CACHE_TTL = int(os.getenv("ASR_CACHE_TTL", "86400"))
+
+# Admission control by audio duration, so long jobs don't starve short ones:
+# bucket -> (max duration in seconds, max concurrent requests, timeout in seconds)
+AUDIO_BUCKETS = {
+    "short": (30, 16, 120),
+    "medium": (300, 4, 900),
+    "long": (float("inf"), 1, 3600),
+}
+bucket_semaphores = {name: asyncio.Semaphore(limit) for name, (_, limit, _) in AUDIO_BUCKETS.items()}
+
+# Whisper gets its own thread per admitted request, so transcriptions never
+# occupy the default executor that probing and file I/O depend on
+whisper_executor = ThreadPoolExecutor(max_workers=sum(limit for _, limit, _ in AUDIO_BUCKETS.values()))
+
+# Pipeline settings for /translate-and-synthesize: queue depth between stages
+# and how long the translator waits for more text before flushing
+PIPELINE_QUEUE_SIZE = 4
+PIPELINE_FLUSH_SECONDS = 0.2
+
 # Pydantic models
 class TranslationResponse(BaseModel):
     original_text: str
@@ -41,19 +115,142 @@ class HealthResponse(BaseModel):
     status: str
     message: str
 
+def load_whisper_model(device: str = WHISPER_DEVICE, compute_type: str = WHISPER_COMPUTE_TYPE) -> WhisperModel:
+    """
+    Load the faster-whisper model, falling back to the local cache if the download fails.
+    
+    If CUDA was picked automatically but the model can't be loaded on it, the
+    model is loaded on the CPU instead.
+    """
+    try:
+        model = WhisperModel(WHISPER_MODEL_SIZE, device=device, compute_type=compute_type)
+        logger.info(f"Whisper {WHISPER_MODEL_SIZE} model loaded successfully ({device}, {compute_type})")
+        return model
+    except Exception as e:
+        logger.error(f"Failed to load Whisper model: {str(e)}")
+        try:
+            logger.info("Trying to load from cache...")
+            return WhisperModel(
+                WHISPER_MODEL_SIZE,
+                device=device,
+                compute_type=compute_type,
+                local_files_only=True
+            )
+        except Exception as cache_error:
+            logger.error(f"Cache loading also failed: {str(cache_error)}")
+            if device == "cuda" and WHISPER_DEVICE_AUTO:
+                logger.warning("Falling back to CPU for the Whisper model")
+                return load_whisper_model(device="cpu", compute_type="int8")
+            raise Exception("Unable to load Whisper model - network connectivity issues")
+
+def warm_up_whisper_model(model: WhisperModel):
+    """
+    Transcribe one second of silence so the first request doesn't pay for
+    backend initialization and memory allocation.
+    """
+    # VAD would filter out the silence and skip the decoder entirely
+    segments, info = model.transcribe(
+        np.zeros(16000, dtype=np.float32),
+        beam_size=WHISPER_BEAM_SIZE,
+        vad_filter=False
+    )
+    list(segments)
+    logger.info("Whisper model warmed up")
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize application - skip model loading to avoid network issues during startup"""
+    """Initialize application - load and warm up the Whisper model once so requests don't pay for it"""
     global whisper_model
     logger.info("Application starting up...")
-    logger.info("Whisper model will be loaded on first request to avoid startup network issues")
-    whisper_model = None
+    try:
+        loop = asyncio.get_event_loop()
+        whisper_model = await loop.run_in_executor(None, load_whisper_model)
+        try:
+            await loop.run_in_executor(None, warm_up_whisper_model, whisper_model)
+        except Exception as e:
+            # CUDA libraries are loaded on first use, so a missing cuBLAS or
+            # cuDNN only shows up here
+            if whisper_model.model.device != "cuda" or not WHISPER_DEVICE_AUTO:
+                raise
+            logger.warning(f"Whisper model failed on CUDA ({str(e)}), falling back to CPU")
+            whisper_model = await loop.run_in_executor(None, load_whisper_model, "cpu", "int8")
+            await loop.run_in_executor(None, warm_up_whisper_model, whisper_model)
+    except Exception as e:
+        # Don't block startup on network issues; retry on first request instead
+        logger.warning(f"Whisper model will be loaded on first request: {str(e)}")
+        whisper_model = None
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
     return HealthResponse(status="healthy", message="LinguaWave API is running")
 
+async def _save_upload(file: UploadFile) -> tuple:
+    """
+    Stream an uploaded file to a temporary file without blocking the event loop.
+    
+    The upload is copied in UPLOAD_CHUNK_SIZE pieces, so memory use stays flat
+    regardless of file size. Returns the temporary file path and the blake2b
+    hex digest of its contents.
+    """
+    hasher = hashlib.blake2b()
+    async with aiofiles.tempfile.NamedTemporaryFile("wb", delete=False, suffix=Path(file.filename).suffix) as temp_audio:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await temp_audio.write(chunk)
+        except BaseException:
+            # Callers never see the path of a failed upload, so remove it here
+            await _remove_file(temp_audio.name)
+            raise
+        return temp_audio.name, hasher.hexdigest()
+
+async def _remove_file(path: str):
+    """
+    Remove a temporary file if it still exists.
+    """
+    try:
+        await aiofiles.os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _probe_duration(audio_path: str) -> float:
+    """
+    Read the audio duration in seconds from the container metadata.
+    """
+    with av.open(audio_path) as container:
+        if container.duration is not None:
+            return container.duration / av.time_base
+        stream = container.streams.audio[0]
+        return float(stream.duration * stream.time_base) if stream.duration else 0.0
+
+@asynccontextmanager
+async def _admit(audio_path: str):
+    """
+    Admit a request into the concurrency bucket matching its audio duration.
+    
+    Yields the bucket timeout in seconds. Raises HTTPException 400 if the
+    audio can't be read and 503 if the long-audio bucket is already full.
+    """
+    loop = asyncio.get_event_loop()
+    try:
+        duration = await loop.run_in_executor(None, _probe_duration, audio_path)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Could not read audio file: {str(e)}")
+    
+    bucket = next(name for name, (max_duration, _, _) in AUDIO_BUCKETS.items() if duration <= max_duration)
+    semaphore = bucket_semaphores[bucket]
+    if bucket == "long" and semaphore.locked():
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy with another long audio file, please retry later",
+            headers={"Retry-After": "60"}
+        )
+    
+    logger.info(f"Audio duration {duration:.1f}s, using {bucket} bucket")
+    async with semaphore:
+        yield AUDIO_BUCKETS[bucket][2]
+
 @app.post("/translate-audio", response_model=TranslationResponse)
 async def translate_audio_endpoint(
     file: UploadFile = File(..., description="Audio file to translate"),
@@ -71,37 +268,48 @@ async def translate_audio_endpoint(
     if not file.content_type or (not file.content_type.startswith('audio/') and file_extension not in allowed_extensions):
         raise HTTPException(status_code=400, detail=f"File must be an audio file. Received: {file.content_type}, Extension: {file_extension}")
     
-    # Create temporary file for uploaded audio
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_audio:
-        try:
-            # Save uploaded file
-            contents = await file.read()
-            temp_audio.write(contents)
-            temp_audio.flush()
-            
+    temp_audio_path = None
+    
+    try:
+        # Stream uploaded file to disk
+        temp_audio_path, content_hash = await _save_upload(file)
+        
+        async def _process() -> tuple:
             # Transcribe audio
             logger.info(f"Transcribing audio file: {file.filename}")
-            transcribed_text = await transcribe_audio_async(temp_audio.name)
+            transcribed_text = await transcribe_audio_async(temp_audio_path, content_hash)
             
             # Translate text
             logger.info(f"Translating to language: {target_language}")
             translated_text = await translate_text_async(transcribed_text, target_language)
-            
-            return TranslationResponse(
-                original_text=transcribed_text,
-                translated_text=translated_text,
-                target_language=target_language,
-                message="Translation completed successfully"
-            )
-            
-        except Exception as e:
-            logger.error(f"Error processing audio: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
+            return transcribed_text, translated_text
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_audio.name):
-                os.unlink(temp_audio.name)
+        async with _admit(temp_audio_path) as timeout:
+            transcribed_text, translated_text = await asyncio.wait_for(_process(), timeout)
+        
+        return TranslationResponse(
+            original_text=transcribed_text,
+            translated_text=translated_text,
+            target_language=target_language,
+            message="Translation completed successfully"
+        )
+        
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        logger.error(f"Timed out processing audio: {file.filename}")
+        raise HTTPException(status_code=504, detail="Timed out processing audio")
+    except RateLimitError as e:
+        logger.error(f"Rate limited while processing audio: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    except Exception as e:
+        logger.error(f"Error processing audio: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
+    
+    finally:
+        # Clean up temporary file
+        if temp_audio_path:
+            await _remove_file(temp_audio_path)
 
 @app.post("/translate-and-synthesize")
 async def translate_and_synthesize_endpoint(
@@ -111,7 +319,7 @@ async def translate_and_synthesize_endpoint(
     """
     Translate audio file and return translated audio.
     
-    Returns the translated audio file.
+    Streams the translated audio file as each chunk is synthesized.
     """
     # Validate file type (more permissive validation)
     logger.info(f"Received file: {file.filename}, content_type: {file.content_type}")
@@ -120,170 +328,369 @@ async def translate_and_synthesize_endpoint(
     if not file.content_type or (not file.content_type.startswith('audio/') and file_extension not in allowed_extensions):
         raise HTTPException(status_code=400, detail=f"File must be an audio file. Received: {file.content_type}, Extension: {file_extension}")
     
-    temp_audio_path = None
-    temp_output_path = None
+    # Admission and the temporary file must outlive this handler while the
+    # response streams, so they are released by the stream itself
+    cleanup = AsyncExitStack()
+    loop = asyncio.get_event_loop()
     
     try:
-        # Create temporary file for uploaded audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_audio:
-            contents = await file.read()
-            temp_audio.write(contents)
-            temp_audio_path = temp_audio.name
-        
-        # Transcribe audio
-        logger.info(f"Transcribing audio file: {file.filename}")
-        transcribed_text = await transcribe_audio_async(temp_audio_path)
+        # Stream uploaded file to disk
+        temp_audio_path, content_hash = await _save_upload(file)
+        cleanup.push_async_callback(_remove_file, temp_audio_path)
+        timeout = await cleanup.enter_async_context(_admit(temp_audio_path))
+        deadline = loop.time() + timeout
         
-        # Translate text
-        logger.info(f"Translating to language: {target_language}")
-        translated_text = await translate_text_async(transcribed_text, target_language)
+        # Transcribe, translate and convert to speech as overlapping stages
+        logger.info(f"Translating audio file {file.filename} to speech in: {target_language}")
+        chunks = translate_and_synthesize_pipeline(temp_audio_path, target_language, content_hash)
+        cleanup.push_async_callback(chunks.aclose)
         
-        # Convert to speech
-        temp_output_path = tempfile.mktemp(suffix=".mp3")
-        logger.info("Converting translated text to speech")
-        await text_to_speech_async(translated_text, temp_output_path, target_language)
-        
-        # Return the audio file
-        return FileResponse(
-            temp_output_path,
-            media_type="audio/mpeg",
-            filename=f"translated_{file.filename}.mp3"
-        )
+        # Wait for the first chunk so early failures still get a proper status code
+        first_chunk = await asyncio.wait_for(chunks.__anext__(), timeout)
         
+    except HTTPException:
+        await cleanup.aclose()
+        raise
+    except asyncio.TimeoutError:
+        await cleanup.aclose()
+        logger.error(f"Timed out processing audio: {file.filename}")
+        raise HTTPException(status_code=504, detail="Timed out processing audio")
+    except RateLimitError as e:
+        await cleanup.aclose()
+        logger.error(f"Rate limited while processing audio: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
     except Exception as e:
+        await cleanup.aclose()
         logger.error(f"Error processing audio: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
     
-    finally:
-        # Clean up temporary files
-        if temp_audio_path and os.path.exists(temp_audio_path):
-            os.unlink(temp_audio_path)
-        # Note: temp_output_path will be cleaned up by FastAPI after response
+    async def _stream():
+        try:
+            yield first_chunk
+            while True:
+                try:
+                    yield await asyncio.wait_for(chunks.__anext__(), max(deadline - loop.time(), 0))
+                except StopAsyncIteration:
+                    break
+            logger.info(f"Finished streaming translated audio for {file.filename}")
+        except Exception as e:
+            # Headers are already sent, so the client sees a truncated stream
+            logger.error(f"Error streaming translated audio: {type(e).__name__}: {str(e)}")
+            raise
+        finally:
+            await cleanup.aclose()
+    
+    return StreamingResponse(
+        _stream(),
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": f'attachment; filename="translated_{file.filename}.mp3"',
+            "Content-Encoding": "identity"
+        }
+    )
+
+def _transcribe_segments(audio_path: str):
+    """
+    Start a faster-whisper transcription, loading the model on first use.
+    
+    Returns a lazy segment generator; decoding happens as it is consumed.
+    """
+    global whisper_model
+    # Load model if not already loaded
+    if whisper_model is None:
+        logger.info("Loading Whisper model (not loaded during startup)...")
+        whisper_model = load_whisper_model()
+    
+    segments, info = whisper_model.transcribe(audio_path, **WHISPER_TRANSCRIBE_OPTIONS)
+    return segments
+
+def _asr_cache_path(content_hash: str) -> str:
+    return os.path.join(ASR_CACHE_DIR, f"{content_hash}_{_asr_cache_key(WHISPER_MODEL_SIZE)}.txt")
+
+async def _load_cached_transcript(content_hash: str) -> Optional[str]:
+    """
+    Return the cached transcript for an upload, or None if missing or expired.
+    
+    Expired transcripts are deleted so the cache doesn't grow without bound.
+    """
+    path = _asr_cache_path(content_hash)
+    try:
+        stat = await aiofiles.os.stat(path)
+        if time.time() - stat.st_mtime > ASR_CACHE_TTL:
+            await aiofiles.os.remove(path)
+            return None
+        async with aiofiles.open(path, "r", encoding="utf-8") as f:
+            text = await f.read()
+    except FileNotFoundError:
+        return None
+    logger.info(f"Transcript cache hit for {content_hash[:16]}")
+    return text
+
+async def _store_transcript(content_hash: str, text: str):
+    """
+    Cache a transcript on disk, writing atomically so readers never see partial files.
+    """
+    path = _asr_cache_path(content_hash)
+    try:
+        await aiofiles.os.makedirs(ASR_CACHE_DIR, exist_ok=True)
+        async with aiofiles.open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            await f.write(text)
+        await aiofiles.os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logger.warning(f"Failed to cache transcript: {str(e)}")
 
-async def transcribe_audio_async(audio_path: str) -> str:
+async def transcribe_audio_async(audio_path: str, content_hash: Optional[str] = None) -> str:
     """
-    Transcribe audio file to text using Whisper model (async wrapper).
+    Transcribe audio file to text using the faster-whisper model (async wrapper).
+    
+    When content_hash is given, a cached transcript of identical audio is
+    returned without running Whisper, and new transcripts are cached.
     """
+    if content_hash:
+        cached = await _load_cached_transcript(content_hash)
+        if cached is not None:
+            return cached
+    
+    stop = threading.Event()
+    
     def _transcribe():
-        global whisper_model
         try:
-            # Load model if not already loaded
-            if whisper_model is None:
-                logger.info("Loading Whisper model (not loaded during startup)...")
-                try:
-                    # Try to load the smallest model first
-                    whisper_model = whisper.load_model("tiny")
-                    logger.info("Whisper tiny model loaded successfully")
-                except Exception as e:
-                    logger.error(f"Failed to load Whisper model: {str(e)}")
-                    # If download fails, try to use cached model if available
-                    try:
-                        import os
-                        cache_dir = os.path.expanduser("~/.cache/whisper")
-                        if os.path.exists(cache_dir):
-                            logger.info("Trying to load from cache...")
-                            whisper_model = whisper.load_model("tiny", download_root=cache_dir)
-                        else:
-                            raise Exception("No cached model available and download failed")
-                    except Exception as cache_error:
-                        logger.error(f"Cache loading also failed: {str(cache_error)}")
-                        raise Exception("Unable to load Whisper model - network connectivity issues")
-            
             logger.info("Transcribing audio...")
-            result = whisper_model.transcribe(audio_path)
-            return result["text"]
+            texts = []
+            for segment in _transcribe_segments(audio_path):
+                if stop.is_set():
+                    return None
+                texts.append(segment.text)
+            return "".join(texts).strip()
         except Exception as e:
             logger.error(f"Error during transcription: {str(e)}")
             raise
     
     # Run CPU-bound operation in thread pool
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _transcribe)
+    future = loop.run_in_executor(whisper_executor, _transcribe)
+    try:
+        text = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # Cancelling doesn't stop the Whisper thread, so stop it at the next
+        # segment and wait for it, keeping the caller's admission slot until then
+        stop.set()
+        await asyncio.gather(future, return_exceptions=True)
+        raise
+    if content_hash:
+        await _store_transcript(content_hash, text)
+    return text
 
 async def translate_text_async(text: str, target_language: str = 'es') -> str:
     """
-    Translate text to target language using Google Translate (async wrapper).
+    Translate text to target language using Google Translate.
+    
+    Cached sentences are reused; the rest are packed into batches translated
+    concurrently, bounded by the translation semaphore and rate limiter.
+    Output order matches input order.
     """
-    def _translate():
-        try:
-            logger.info("Translating text...")
-            # Split text into smaller chunks (sentences)
-            sentences = text.split('. ')
-            translated_sentences = []
-            
-            for sentence in sentences:
-                if not sentence.strip():
-                    continue
-                    
-                try:
-                    # Add a small delay to avoid rate limiting
-                    time.sleep(0.5)
-                    translator = GoogleTranslator(source='auto', target=target_language)
-                    translated = translator.translate(sentence)
-                    translated_sentences.append(translated)
-                    logger.info(f"Translated: {sentence[:50]}...")
-                except Exception as e:
-                    logger.warning(f"Failed to translate sentence: {str(e)}")
-                    # Keep the original sentence if translation fails
-                    translated_sentences.append(sentence)
-            
-            return '. '.join(translated_sentences)
-        except Exception as e:
-            logger.error(f"Error during translation: {str(e)}")
-            raise
+    logger.info("Translating text...")
+    # Split text into sentences and translate only the ones not already cached
+    sentences, separators = _split_sentences(text)
+    translated_sentences = translation_cache.lookup(sentences, target_language)
+    missing = [i for i, translated in enumerate(translated_sentences) if translated is None]
+    batches = _make_batches([sentences[i] for i in missing])
+    loop = asyncio.get_event_loop()
+    
+    def _acquire():
+        # Called from the translation threads before every request
+        asyncio.run_coroutine_threadsafe(translate_limiter.acquire(), loop).result()
+    
+    async def _translate(i: int, batch: list) -> list:
+        async with translate_semaphore:
+            translated = await loop.run_in_executor(
+                translate_executor, _translate_batch, batch, target_language, _acquire
+            )
+        logger.info(f"Translated batch {i+1}/{len(batches)} ({len(batch)} sentences)")
+        return translated
+    
+    try:
+        results = await asyncio.gather(*(_translate(i, batch) for i, batch in enumerate(batches)))
+    except Exception as e:
+        logger.error(f"Error during translation: {str(e)}")
+        raise
+    
+    results = [sentence for translated in results for sentence in translated]
+    for i, translated in zip(missing, results):
+        translated_sentences[i] = translated
+    translation_cache.store([sentences[i] for i in missing], results, target_language)
+    
+    return ''.join(sentence + separator for sentence, separator in zip(translated_sentences, separators))
+
+async def _synthesize_chunk(chunk: str, language: str) -> bytes:
+    """
+    Synthesize one text chunk to MP3 bytes in memory, bounded by the TTS semaphore.
+    """
+    def _synthesize():
+        buffer = io.BytesIO()
+        PooledGTTS(text=chunk, lang=language, slow=False).write_to_fp(buffer)
+        return buffer.getvalue()
+    
+    async with tts_semaphore:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(tts_executor, _with_retry, _synthesize)
+
+async def _asr_stage(audio_path: str, asr_q: asyncio.Queue, stop: threading.Event, content_hash: Optional[str] = None):
+    """
+    Pipeline stage: push transcribed segment text to asr_q as Whisper decodes it.
+    
+    A cached transcript for content_hash is pushed in one piece instead.
+    """
+    if content_hash:
+        cached = await _load_cached_transcript(content_hash)
+        if cached is not None:
+            await asr_q.put(cached)
+            await asr_q.put(None)
+            return
     
-    # Run I/O-bound operation in thread pool
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _translate)
+    texts = []
+    
+    def _produce():
+        for segment in _transcribe_segments(audio_path):
+            if stop.is_set():
+                return
+            texts.append(segment.text)
+            future = asyncio.run_coroutine_threadsafe(asr_q.put(segment.text), loop)
+            # Block on the bounded queue for backpressure, but give up if the pipeline stops
+            while True:
+                try:
+                    future.result(timeout=0.5)
+                    break
+                except FutureTimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return
+    
+    logger.info("Transcribing audio...")
+    future = loop.run_in_executor(whisper_executor, _produce)
+    try:
+        await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # Wait for the Whisper thread to notice the stop event before exiting
+        stop.set()
+        await asyncio.gather(future, return_exceptions=True)
+        raise
+    await asr_q.put(None)
+    if content_hash and not stop.is_set():
+        await _store_transcript(content_hash, "".join(texts).strip())
 
-async def text_to_speech_async(text: str, output_path: str, language: str = 'es'):
+async def _translation_stage(asr_q: asyncio.Queue, mt_q: asyncio.Queue, target_language: str):
     """
-    Convert text to speech using Google Text-to-Speech (async wrapper).
+    Pipeline stage: translate transcribed text as it arrives.
+    
+    Text is buffered until a batch fills up or no new segment arrives within
+    PIPELINE_FLUSH_SECONDS, then complete sentences are translated and pushed
+    to mt_q. A trailing sentence fragment waits for the rest of its sentence.
     """
-    def _text_to_speech():
+    buffer = ""
+    done = False
+    while not done:
         try:
-            logger.info("Converting text to speech...")
-            # Split text into chunks to handle large texts
-            max_chunk_size = 5000
-            chunks = [text[i:i+max_chunk_size] for i in range(0, len(text), max_chunk_size)]
-            
-            # Create temporary files for each chunk
-            temp_files = []
-            for i, chunk in enumerate(chunks):
-                temp_file = f"temp_{i}_{os.getpid()}.mp3"
-                tts = gTTS(text=chunk, lang=language, slow=False)
-                tts.save(temp_file)
-                temp_files.append(temp_file)
-                logger.info(f"Created audio chunk {i+1}/{len(chunks)}")
-            
-            # Combine all temporary files
-            if len(temp_files) > 1:
-                # Use ffmpeg to concatenate audio files
-                concat_file = f"concat_list_{os.getpid()}.txt"
-                with open(concat_file, "w") as f:
-                    for temp_file in temp_files:
-                        f.write(f"file '{temp_file}'\n")
-                
-                os.system(f"ffmpeg -f concat -safe 0 -i {concat_file} -c copy {output_path}")
-                
-                # Clean up temporary files
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                if os.path.exists(concat_file):
-                    os.remove(concat_file)
+            text = await asyncio.wait_for(asr_q.get(), timeout=PIPELINE_FLUSH_SECONDS)
+            if text is None:
+                done = True
             else:
-                # If only one chunk, just rename the file
-                os.rename(temp_files[0], output_path)
-                
-            logger.info(f"Audio saved to {output_path}")
-        except Exception as e:
-            logger.error(f"Error during text-to-speech conversion: {str(e)}")
-            raise
+                buffer += text
+                if len(buffer) < TRANSLATE_BATCH_CHARS:
+                    continue
+        except asyncio.TimeoutError:
+            pass
+        
+        sentences, _ = _split_sentences(buffer)
+        if not done and sentences and not re.search(r'[.!?]$', sentences[-1]) and len(buffer) < TRANSLATE_BATCH_CHARS:
+            buffer = sentences.pop()
+        else:
+            buffer = ""
+        
+        if sentences:
+            translated = await translate_text_async(' '.join(sentences), target_language)
+            await mt_q.put(translated)
+    await mt_q.put(None)
+
+async def _tts_stage(mt_q: asyncio.Queue, tts_q: asyncio.Queue, language: str):
+    """
+    Pipeline stage: start synthesizing translated text as it arrives.
     
-    # Run I/O-bound operation in thread pool
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _text_to_speech)
+    Synthesis tasks are pushed to tts_q in order, so chunks can be generated
+    concurrently while the consumer still receives them in sequence.
+    """
+    max_chunk_size = 5000
+    while (text := await mt_q.get()) is not None:
+        for start in range(0, len(text), max_chunk_size):
+            task = asyncio.ensure_future(_synthesize_chunk(text[start:start+max_chunk_size], language))
+            try:
+                await tts_q.put(task)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+    await tts_q.put(None)
+
+async def translate_and_synthesize_pipeline(audio_path: str, target_language: str = 'es', content_hash: Optional[str] = None):
+    """
+    Transcribe, translate and synthesize audio as overlapping pipeline stages.
+    
+    Whisper segments stream into the translator and translated text streams
+    into text-to-speech through bounded queues, so total latency approaches
+    the slowest stage rather than the sum of all three.
+    
+    Yields the translated speech as MP3 chunks, in order, as soon as each one
+    is synthesized.
+    """
+    asr_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    mt_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    tts_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = threading.Event()
+    
+    tasks = [
+        asyncio.create_task(_asr_stage(audio_path, asr_q, stop, content_hash)),
+        asyncio.create_task(_translation_stage(asr_q, mt_q, target_language)),
+        asyncio.create_task(_tts_stage(mt_q, tts_q, target_language)),
+    ]
+    stages = asyncio.gather(*tasks)
+    in_flight = None
+    chunk_count = 0
+    try:
+        while True:
+            getter = asyncio.ensure_future(tts_q.get())
+            # Wake up on the next chunk, or as soon as any stage fails
+            if not stages.done():
+                await asyncio.wait({getter, stages}, return_when=asyncio.FIRST_COMPLETED)
+            if stages.done() and not stages.cancelled() and stages.exception() is not None:
+                getter.cancel()
+                raise stages.exception()
+            
+            task = await getter
+            if task is None:
+                break
+            in_flight = task
+            audio = await task
+            in_flight = None
+            chunk_count += 1
+            logger.info(f"Created audio chunk {chunk_count}")
+            yield audio
+        
+        if not chunk_count:
+            raise ValueError("No speech was detected in the audio")
+    finally:
+        # Stop the Whisper thread and cancel every remaining stage
+        stop.set()
+        stages.cancel()
+        synthesis = [in_flight] if in_flight is not None else []
+        while not tts_q.empty():
+            task = tts_q.get_nowait()
+            if task is not None:
+                synthesis.append(task)
+        for task in synthesis:
+            task.cancel()
+        # Wait for cancellation to finish so no task outlives the request
+        # or leaves an exception unretrieved
+        await asyncio.gather(stages, *synthesis, return_exceptions=True)
 
 if __name__ == "__main__":
     import uvicorn